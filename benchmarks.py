@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+from unittest import mock
+
+import game
+from game import GameConfig, PuzzleForgeGame
+from llm_generator import generate_ai_puzzle
+from puzzles import PuzzleProvider
+from utils import normalize_answer, save_json_file
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_AI_DELAYS_MS = [0, 50, 200]
+DIFFICULTIES = ["easy", "medium", "hard"]
+CATEGORIES = ["Riddle", "Math", "Logic", "Wordplay"]
+
+
+# ---------- Synthetic data ----------
+def make_corpus(size: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "category": rng.choice(CATEGORIES),
+            "question": f"Synthetic puzzle #{i}: what is the secret word?",
+            "answer": f"Answer {i}",
+            "hints": ["First hint.", "Second hint.", "Third hint."],
+            "explanation": "Generated for benchmarking.",
+            "difficulty": rng.choice(DIFFICULTIES),
+        }
+        for i in range(size)
+    ]
+
+
+def make_leaderboard(size: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "player": f"Player{i}",
+            "score": rng.randint(0, 1000),
+            "rounds": rng.randint(1, 20),
+            "difficulty": rng.choice(DIFFICULTIES),
+            "theme": "scifi",
+            "timer_mode": True,
+            "demo_mode": False,
+        }
+        for i in range(size)
+    ]
+
+
+def make_guesses(corpus: List[Dict[str, Any]], seed: int) -> List[str]:
+    # Mix of exact, messy-but-correct and wrong answers, as players type them.
+    rng = random.Random(seed)
+    guesses = []
+    for item in corpus:
+        roll = rng.random()
+        if roll < 0.4:
+            guesses.append(item["answer"])
+        elif roll < 0.7:
+            guesses.append(f"  {item['answer'].upper()}   ")
+        else:
+            guesses.append("wrong guess")
+    return guesses
+
+
+# ---------- Timing helpers ----------
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    return {
+        "iterations": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": pct(50) * 1000,
+        "p95_ms": pct(95) * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _time_calls(fn: Callable[[], Any], iterations: int, setup: Callable[[], Any] = lambda: None) -> Dict[str, float]:
+    samples = []
+    for _ in range(iterations):
+        setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return _summarize(samples)
+
+
+def _iterations_for(size: int, small: int, large: int) -> int:
+    return small if size <= 1_000 else large
+
+
+@contextmanager
+def _quiet_game(leaderboard_path: str) -> Iterator[PuzzleForgeGame]:
+    # Screen clears and "Press Enter" prompts would dominate the timings, so they are stubbed out.
+    with mock.patch.object(game, "LEADERBOARD_FILE", leaderboard_path), mock.patch.object(
+        game, "clear_screen", lambda: None
+    ), mock.patch.object(game, "wait", lambda: None), redirect_stdout(io.StringIO()):
+        instance = PuzzleForgeGame.__new__(PuzzleForgeGame)
+        instance.config = GameConfig(player_name="Bench")
+        instance.score = 500
+        yield instance
+
+
+_STUB_PUZZLE = json.dumps(
+    {
+        "category": "Logic",
+        "question": "Stub question?",
+        "answer": "stub",
+        "hints": ["One.", "Two.", "Three."],
+        "explanation": "Stubbed response.",
+        "difficulty": "easy",
+    }
+)
+
+
+class _StubCompletionsHandler(BaseHTTPRequestHandler):
+    """Answers any POST like the chat-completions API after the server's injected delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.server.delay_s)  # type: ignore[attr-defined]
+        body = json.dumps(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "stub"),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": _STUB_PUZZLE},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def _stub_openai_server(delay_s: float) -> Iterator[None]:
+    """
+    Runs a local chat-completions server and points the real OpenAI SDK at it,
+    so the measured overhead includes client setup, HTTP and response parsing.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubCompletionsHandler)
+    server.delay_s = delay_s  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    try:
+        with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "bench-key", "OPENAI_BASE_URL": base_url}):
+            yield
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# ---------- Benchmarks ----------
+def bench_corpus(size: int, workdir: Path, seed: int) -> Dict[str, Any]:
+    corpus = make_corpus(size, seed)
+    corpus_path = workdir / f"corpus_{size}.json"
+    save_json_file(str(corpus_path), corpus)
+    calibration_path = str(workdir / "missing_calibration.json")
+
+    start = time.perf_counter()
+    provider = PuzzleProvider(str(corpus_path), calibration_path=calibration_path)
+    load_s = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    iterations = _iterations_for(size, 2000, 50)
+    get_puzzle = _time_calls(lambda: provider.get_puzzle(difficulty=rng.choice(DIFFICULTIES)), iterations)
+    demo_get_puzzle = _time_calls(
+        lambda: provider.get_puzzle(difficulty="easy", demo_mode=True, round_index=rng.randint(1, 20)),
+        iterations,
+    )
+
+    guesses = make_guesses(corpus, seed)
+    answers = [item["answer"] for item in corpus]
+    start = time.perf_counter()
+    correct = sum(1 for guess, answer in zip(guesses, answers) if normalize_answer(guess) == normalize_answer(answer))
+    grading_s = time.perf_counter() - start
+
+    return {
+        "corpus_bytes": corpus_path.stat().st_size,
+        "load_ms": load_s * 1000,
+        "get_puzzle": get_puzzle,
+        "get_puzzle_demo": demo_get_puzzle,
+        "grading": {
+            "answers": len(answers),
+            "correct": correct,
+            "total_ms": grading_s * 1000,
+            "answers_per_sec": len(answers) / grading_s if grading_s else None,
+        },
+    }
+
+
+def bench_leaderboard(size: int, workdir: Path, seed: int) -> Dict[str, Any]:
+    seed_path = workdir / f"leaderboard_seed_{size}.json"
+    board_path = workdir / f"leaderboard_{size}.json"
+    save_json_file(str(seed_path), make_leaderboard(size, seed))
+    seed_bytes = seed_path.read_bytes()
+
+    def reset_board() -> None:
+        board_path.write_bytes(seed_bytes)
+
+    iterations = _iterations_for(size, 50, 5)
+    with _quiet_game(str(board_path)) as instance:
+        save = _time_calls(instance._save_leaderboard_score, iterations, setup=reset_board)
+        show_full = _time_calls(instance._show_leaderboard, iterations, setup=reset_board)
+        # After a save the file holds the top 10, which is what players normally see.
+        reset_board()
+        instance._save_leaderboard_score()
+        show_top = _time_calls(instance._show_leaderboard, 200)
+
+    return {
+        "file_bytes": len(seed_bytes),
+        "save_score": save,
+        "show_leaderboard": show_full,
+        "show_leaderboard_after_save": show_top,
+    }
+
+
+def bench_ai_generation(delays_ms: List[int], workdir: Path, seed: int, iterations: int = 20) -> Dict[str, Any]:
+    if importlib.util.find_spec("openai") is None:
+        return {"skipped": "openai SDK is not installed"}
+
+    corpus_path = workdir / "ai_corpus.json"
+    save_json_file(str(corpus_path), make_corpus(100, seed))
+    provider = PuzzleProvider(str(corpus_path), calibration_path=str(workdir / "missing_calibration.json"))
+
+    results: Dict[str, Any] = {}
+    for delay_ms in delays_ms:
+        failures = 0
+
+        def generate() -> None:
+            nonlocal failures
+            if generate_ai_puzzle("easy") is None:
+                failures += 1
+
+        with _stub_openai_server(delay_ms / 1000):
+            generate_stats = _time_calls(generate, iterations)
+            get_puzzle = _time_calls(lambda: provider.get_puzzle(difficulty="easy", use_ai=True), iterations)
+        generate_stats["overhead_ms"] = generate_stats["mean_ms"] - delay_ms
+        generate_stats["failures"] = failures
+        get_puzzle["overhead_ms"] = get_puzzle["mean_ms"] - delay_ms
+        results[str(delay_ms)] = {"generate_ai_puzzle": generate_stats, "get_puzzle_ai": get_puzzle}
+    return results
+
+
+def run(sizes: List[int], delays_ms: List[int], seed: int) -> Dict[str, Any]:
+    report: Dict[str, Any] = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "sizes": sizes,
+        },
+        "corpus": {},
+        "leaderboard": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="puzzleforge-bench-") as tmp:
+        workdir = Path(tmp)
+        for size in sizes:
+            print(f"Benchmarking size {size:,}...")
+            report["corpus"][str(size)] = bench_corpus(size, workdir, seed)
+            report["leaderboard"][str(size)] = bench_leaderboard(size, workdir, seed)
+        print("Benchmarking AI generation...")
+        report["ai_generation"] = bench_ai_generation(delays_ms, workdir, seed)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run PuzzleForge hot-path benchmarks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Corpus/leaderboard sizes.")
+    parser.add_argument(
+        "--ai-delays-ms", type=int, nargs="+", default=DEFAULT_AI_DELAYS_MS, help="Injected AI stub delays."
+    )
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for synthetic data.")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON results file.")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.ai_delays_ms, args.seed)
+    save_json_file(args.output, report)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import argparse
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from settings import DIFFICULTY_CALIBRATION_FILE, MAX_ATTEMPTS, ROUND_HISTORY_FILE
+from utils import save_json_file
+
+DIFFICULTY_ORDER = ["easy", "medium", "hard"]
+MAX_HINTS = 3
+# Solve times above this are pooled into one bucket so each histogram stays bounded.
+MAX_TRACKED_SECONDS = 3600
+MIN_ROUNDS = 20
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass
+class PuzzleStats:
+    label: str
+    rounds: int = 0
+    solved: int = 0
+    timed_solves: int = 0
+    hints_total: int = 0
+    attempts_total: int = 0
+    solve_seconds: Counter = field(default_factory=Counter)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.rounds += 1
+        self.hints_total += max(_as_int(record.get("hints")), 0)
+        self.attempts_total += max(_as_int(record.get("attempts")), 0)
+        if record.get("solved") is True:
+            self.solved += 1
+            # Timer-off rounds are recorded with 0 seconds, so they only count towards solve rate.
+            if record.get("timer_mode") is True:
+                seconds = min(max(_as_int(record.get("seconds")), 0), MAX_TRACKED_SECONDS)
+                self.solve_seconds[seconds] += 1
+                self.timed_solves += 1
+
+    @property
+    def solve_rate(self) -> float:
+        return self.solved / self.rounds if self.rounds else 0.0
+
+    @property
+    def mean_hints(self) -> float:
+        return self.hints_total / self.rounds if self.rounds else 0.0
+
+    @property
+    def mean_attempts(self) -> float:
+        return self.attempts_total / self.rounds if self.rounds else 0.0
+
+    def solve_seconds_percentile(self, pct: float) -> Optional[int]:
+        if not self.timed_solves:
+            return None
+        # Nearest-rank percentile over the seconds histogram.
+        rank = max(1, int(-(-self.timed_solves * pct // 100)))
+        seen = 0
+        for seconds in sorted(self.solve_seconds):
+            seen += self.solve_seconds[seconds]
+            if seen >= rank:
+                return seconds
+        return MAX_TRACKED_SECONDS
+
+    @property
+    def hardness(self) -> float:
+        """Failure rate dominates; hint and extra-attempt usage break ties."""
+        hint_share = self.mean_hints / MAX_HINTS
+        attempt_share = max(self.mean_attempts - 1, 0) / max(MAX_ATTEMPTS - 1, 1)
+        return (1 - self.solve_rate) + 0.25 * hint_share + 0.25 * attempt_share
+
+
+def iter_round_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Streams round records from a JSONL history file, skipping malformed lines."""
+    p = Path(path)
+    if not p.exists():
+        return
+    # errors="replace" turns undecodable bytes into a line that fails json.loads below.
+    with p.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("question"), str):
+                yield record
+
+
+def aggregate_rounds(records: Iterable[Dict[str, Any]]) -> Dict[str, PuzzleStats]:
+    stats: Dict[str, PuzzleStats] = {}
+    for record in records:
+        question = record["question"]
+        entry = stats.get(question)
+        if entry is None:
+            entry = stats[question] = PuzzleStats(label=str(record.get("difficulty", "easy")))
+        entry.add(record)
+    return stats
+
+
+def assign_difficulties(stats: Dict[str, PuzzleStats], min_rounds: int = MIN_ROUNDS) -> Dict[str, str]:
+    """
+    Ranks puzzles with enough rounds by hardness and hands out difficulty labels
+    in the same proportions as their hand-assigned labels, so each pool keeps its size.
+    Puzzles with too little data keep their original label.
+    """
+    assigned = {question: entry.label for question, entry in stats.items()}
+    measured = [q for q, entry in stats.items() if entry.rounds >= min_rounds]
+    if not measured:
+        return assigned
+
+    quotas = Counter(stats[q].label for q in measured)
+    labels: List[str] = []
+    for difficulty in DIFFICULTY_ORDER:
+        labels.extend([difficulty] * quotas.pop(difficulty, 0))
+    # Unknown labels go last so they sit with the hardest puzzles.
+    for difficulty in sorted(quotas):
+        labels.extend([difficulty] * quotas[difficulty])
+
+    ranked = sorted(measured, key=lambda q: (stats[q].hardness, q))
+    for question, difficulty in zip(ranked, labels):
+        assigned[question] = difficulty
+    return assigned
+
+
+def build_calibration(stats: Dict[str, PuzzleStats], min_rounds: int = MIN_ROUNDS) -> Dict[str, Dict[str, Any]]:
+    assigned = assign_difficulties(stats, min_rounds=min_rounds)
+    calibration: Dict[str, Dict[str, Any]] = {}
+    for question, entry in sorted(stats.items()):
+        calibration[question] = {
+            "difficulty": assigned[question],
+            "label": entry.label,
+            "measured": entry.rounds >= min_rounds,
+            "rounds": entry.rounds,
+            "solve_rate": round(entry.solve_rate, 4),
+            "mean_hints": round(entry.mean_hints, 4),
+            "mean_attempts": round(entry.mean_attempts, 4),
+            "timed_solves": entry.timed_solves,
+            "p50_seconds": entry.solve_seconds_percentile(50),
+            "p90_seconds": entry.solve_seconds_percentile(90),
+            "p99_seconds": entry.solve_seconds_percentile(99),
+            "hardness": round(entry.hardness, 4),
+        }
+    return calibration
+
+
+def calibrate(
+    history_path: str = ROUND_HISTORY_FILE,
+    output_path: str = DIFFICULTY_CALIBRATION_FILE,
+    min_rounds: int = MIN_ROUNDS,
+) -> Dict[str, Dict[str, Any]]:
+    calibration = build_calibration(aggregate_rounds(iter_round_records(history_path)), min_rounds=min_rounds)
+    save_json_file(output_path, calibration)
+    return calibration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recalibrate puzzle difficulty from recorded rounds.")
+    parser.add_argument("--history", default=ROUND_HISTORY_FILE, help="Round history JSONL file.")
+    parser.add_argument("--output", default=DIFFICULTY_CALIBRATION_FILE, help="Calibration JSON to write.")
+    parser.add_argument("--min-rounds", type=int, default=MIN_ROUNDS, help="Rounds needed before relabeling.")
+    args = parser.parse_args()
+
+    calibration = calibrate(args.history, args.output, min_rounds=args.min_rounds)
+    changed = sum(1 for entry in calibration.values() if entry["difficulty"] != entry["label"])
+    print(f"Calibrated {len(calibration)} puzzles ({changed} relabeled) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, List
 
 from puzzles import PuzzleProvider, Puzzle
-from settings import THEMES, DEFAULT_THEME, MAX_ATTEMPTS, LEADERBOARD_FILE
+from settings import THEMES, DEFAULT_THEME, MAX_ATTEMPTS, LEADERBOARD_FILE, ROUND_HISTORY_FILE
 from utils import (
     clear_screen,
     print_banner,
@@ -16,6 +16,7 @@ from utils import (
     elapsed_seconds,
     load_json_file,
     save_json_file,
+    append_jsonl_record,
     wait,
     success_text,
     error_text,
@@ -38,6 +39,27 @@ class GameConfig:
     sound_mode: bool = False
 
 
+@dataclass(frozen=True)
+class ScoringWeights:
+    """Point weights for _calculate_points; rescoring.py evaluates alternatives to these."""
+
+    base: int = 120
+    attempt_penalty: int = 20
+    hint_penalty: int = 15
+    time_step: int = 10
+    time_penalty_cap: int = 20
+    streak_bonus: int = 5
+    streak_bonus_cap: int = 25
+    min_points: int = 20
+
+    def __post_init__(self) -> None:
+        if self.time_step <= 0:
+            raise ValueError(f"time_step must be positive, got {self.time_step}")
+
+
+SCORING_WEIGHTS = ScoringWeights()
+
+
 class PuzzleForgeGame:
     def __init__(self) -> None:
         self.provider = PuzzleProvider()
@@ -200,6 +222,7 @@ class PuzzleForgeGame:
             if cmd == "skip":
                 round_time = elapsed_seconds(timer_start) if timer_start else 0
                 self.round_times.append(round_time)
+                self._record_round(puzzle, False, attempts_used, hint_level, round_time)
                 if self.config.sound_mode:
                     play_error_sound()
                 print(warning_text(f"\n⏭️  Skipped. {theme_pack['fail_text']}"))
@@ -216,6 +239,7 @@ class PuzzleForgeGame:
                     hints_used=hint_level,
                     seconds_used=round_time,
                 )
+                self._record_round(puzzle, True, attempts_used, hint_level, round_time)
                 self.score += round_points
                 if self.config.sound_mode:
                     play_success_sound()
@@ -235,6 +259,7 @@ class PuzzleForgeGame:
                 else:
                     round_time = elapsed_seconds(timer_start) if timer_start else 0
                     self.round_times.append(round_time)
+                    self._record_round(puzzle, False, attempts_used, hint_level, round_time)
                     print(error_text(f"\nNo attempts left. {theme_pack['fail_text']}"))
                     print(f"Answer: {puzzle.answer}")
                     print(f"Explanation: {puzzle.explanation}")
@@ -242,13 +267,32 @@ class PuzzleForgeGame:
 
         return False
 
+    def _record_round(
+        self, puzzle: Puzzle, solved: bool, attempts_used: int, hints_used: int, seconds_used: int
+    ) -> None:
+        # AI puzzles are one-offs that calibration can never apply to, and demo mode
+        # replays a fixed puzzle order that would skew solve rates.
+        if puzzle.source != "fallback" or self.config.demo_mode:
+            return
+        record = {
+            "question": puzzle.question,
+            "difficulty": puzzle.label or puzzle.difficulty,
+            "solved": solved,
+            "attempts": attempts_used,
+            "hints": hints_used,
+            "seconds": seconds_used,
+            "streak": self.streak,
+            "timer_mode": self.config.timer_mode,
+        }
+        append_jsonl_record(ROUND_HISTORY_FILE, record)
+
     def _calculate_points(self, attempts_used: int, hints_used: int, seconds_used: int) -> int:
-        base = 120
-        attempt_penalty = (attempts_used - 1) * 20
-        hint_penalty = hints_used * 15
-        time_penalty = min(seconds_used // 10, 20) if self.config.timer_mode else 0
-        streak_bonus = min(self.streak * 5, 25)
-        return max(20, base - attempt_penalty - hint_penalty - time_penalty + streak_bonus)
+        w = SCORING_WEIGHTS
+        attempt_penalty = (attempts_used - 1) * w.attempt_penalty
+        hint_penalty = hints_used * w.hint_penalty
+        time_penalty = min(seconds_used // w.time_step, w.time_penalty_cap) if self.config.timer_mode else 0
+        streak_bonus = min(self.streak * w.streak_bonus, w.streak_bonus_cap)
+        return max(w.min_points, w.base - attempt_penalty - hint_penalty - time_penalty + streak_bonus)
 
     def _show_results(self) -> None:
         clear_screen()
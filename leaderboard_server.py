@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from settings import LEADERBOARD_FILE
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# How often the leaderboard file is stat()ed for new saves; requests in between never touch disk.
+POLL_INTERVAL = 1.0
+MAX_HEADER_BYTES = 16 * 1024
+
+
+# ---------- Payloads ----------
+def leaderboard_rows(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Same rows and defaults as PuzzleForgeGame._show_leaderboard."""
+    return [
+        {
+            "rank": idx,
+            "player": row.get("player", "Player"),
+            "score": row.get("score", 0),
+            "difficulty": row.get("difficulty", "easy"),
+            "theme": row.get("theme", "classic"),
+            "rounds": row.get("rounds", 0),
+        }
+        for idx, row in enumerate(data, start=1)
+    ]
+
+
+def leaderboard_stats(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    scores = [row.get("score", 0) for row in data]
+    by_difficulty: Dict[str, List[int]] = {}
+    for row in data:
+        by_difficulty.setdefault(row.get("difficulty", "easy"), []).append(row.get("score", 0))
+
+    return {
+        "entries": len(data),
+        "top_score": max(scores) if scores else None,
+        "mean_score": sum(scores) / len(scores) if scores else None,
+        "total_rounds": sum(row.get("rounds", 0) for row in data),
+        "difficulty": {
+            name: {"entries": len(values), "mean_score": sum(values) / len(values)}
+            for name, values in sorted(by_difficulty.items())
+        },
+        "themes": dict(sorted(Counter(row.get("theme", "classic") for row in data).items())),
+        "timer_mode": sum(1 for row in data if row.get("timer_mode")),
+        "demo_mode": sum(1 for row in data if row.get("demo_mode")),
+    }
+
+
+class CachedResponse:
+    __slots__ = ("body", "etag", "ok_head", "not_modified_head")
+
+    def __init__(self, payload: Any) -> None:
+        self.body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        common = f"ETag: {self.etag}\r\nCache-Control: no-cache\r\n"
+        self.ok_head = (
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(self.body)}\r\n{common}"
+        ).encode("ascii")
+        self.not_modified_head = f"HTTP/1.1 304 Not Modified\r\n{common}".encode("ascii")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _valid_row(row: Any) -> bool:
+    return (
+        isinstance(row, dict)
+        and _is_number(row.get("score", 0))
+        and _is_number(row.get("rounds", 0))
+        and isinstance(row.get("player", "Player"), str)
+        and isinstance(row.get("difficulty", "easy"), str)
+        and isinstance(row.get("theme", "classic"), str)
+    )
+
+
+def _build_responses(data: List[Dict[str, Any]]) -> Dict[str, CachedResponse]:
+    return {
+        "/leaderboard": CachedResponse(leaderboard_rows(data)),
+        "/stats": CachedResponse(leaderboard_stats(data)),
+    }
+
+
+class LeaderboardCache:
+    """
+    Holds pre-serialized responses for each route. The file is only re-parsed when
+    its size/mtime changes (i.e. a score was saved) or invalidate() is called.
+    """
+
+    def __init__(self, path: str = LEADERBOARD_FILE, poll_interval: float = POLL_INTERVAL) -> None:
+        self.path = path
+        self.poll_interval = poll_interval
+        self._signature: Optional[Tuple[int, int]] = None
+        self._next_check = 0.0
+        self._responses: Dict[str, CachedResponse] = {}
+        self.reloads = 0
+
+    def invalidate(self) -> None:
+        self._signature = None
+        self._next_check = 0.0
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _read(self) -> Optional[List[Dict[str, Any]]]:
+        # Unlike load_json_file, a missing file is the only case that means "empty";
+        # unreadable or invalid content returns None so the previous cache is kept.
+        p = Path(self.path)
+        if not p.exists():
+            return []
+        try:
+            with p.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, list) or not all(_valid_row(row) for row in data):
+            return None
+        return data
+
+    def _reload(self) -> bool:
+        data = self._read()
+        if data is None:
+            if not self._responses:
+                # Nothing cached yet: serve an empty board until the file parses.
+                self._responses = _build_responses([])
+            return False
+        self._responses = _build_responses(data)
+        self.reloads += 1
+        return True
+
+    def get(self, route: str) -> Optional[CachedResponse]:
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.poll_interval
+            signature = self._file_signature()
+            if signature != self._signature or not self._responses:
+                # Only remember the signature once that version of the file was accepted,
+                # so a half-written save is retried on the next poll.
+                if self._reload():
+                    self._signature = signature
+        return self._responses.get(route)
+
+
+# ---------- HTTP ----------
+_NOT_FOUND_BODY = b'{"error":"not found"}'
+_NOT_FOUND = (
+    b"HTTP/1.1 404 Not Found\r\nContent-Type: application/json\r\n"
+    + f"Content-Length: {len(_NOT_FOUND_BODY)}\r\n".encode("ascii")
+)
+_NOT_ALLOWED = b"HTTP/1.1 405 Method Not Allowed\r\nAllow: GET, HEAD\r\nContent-Length: 0\r\n"
+_SERVER_ERROR = b"HTTP/1.1 500 Internal Server Error\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+_BAD_REQUEST = b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+_KEEP_ALIVE = b"Connection: keep-alive\r\n\r\n"
+_CLOSE = b"Connection: close\r\n\r\n"
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class LeaderboardProtocol(asyncio.Protocol):
+    """Minimal HTTP/1.1 handler with keep-alive and pipelining for the read-only routes."""
+
+    def __init__(self, cache: LeaderboardCache) -> None:
+        self.cache = cache
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = b""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        while self.transport is not None and not self.transport.is_closing():
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self.buffer) > MAX_HEADER_BYTES:
+                    self._reply(_BAD_REQUEST, close=True)
+                return
+            head, self.buffer = self.buffer[:end], self.buffer[end + 4 :]
+            try:
+                self._handle(head)
+            except Exception:
+                self._reply(_SERVER_ERROR, close=True)
+
+    def _handle(self, head: bytes) -> None:
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split()
+        if len(parts) != 3:
+            self._reply(_BAD_REQUEST, close=True)
+            return
+        method, target, version = parts
+
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+        tail = _CLOSE if close else _KEEP_ALIVE
+
+        if method not in {"GET", "HEAD"}:
+            self._reply(_NOT_ALLOWED + tail, close=close)
+            return
+
+        response = self.cache.get(target.split("?", 1)[0].rstrip("/") or "/")
+        if response is None:
+            body = b"" if method == "HEAD" else _NOT_FOUND_BODY
+            self._reply(_NOT_FOUND + tail + body, close=close)
+            return
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, response.etag):
+            self._reply(response.not_modified_head + tail, close=close)
+        elif method == "HEAD":
+            self._reply(response.ok_head + tail, close=close)
+        else:
+            self._reply(response.ok_head + tail + response.body, close=close)
+
+    def _reply(self, payload: bytes, close: bool) -> None:
+        if self.transport is None:
+            return
+        self.transport.write(payload)
+        if close:
+            self.transport.close()
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    path: str = LEADERBOARD_FILE,
+    poll_interval: float = POLL_INTERVAL,
+) -> None:
+    cache = LeaderboardCache(path, poll_interval=poll_interval)
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: LeaderboardProtocol(cache), host, port, reuse_address=True)
+    print(f"Serving {path} on http://{host}:{port} (/leaderboard, /stats)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+# ---------- Load test ----------
+async def _load_worker(
+    host: str, port: int, route: str, etag: Optional[str], deadline: float, pipeline: int
+) -> Tuple[int, Counter]:
+    reader, writer = await asyncio.open_connection(host, port)
+    extra = f"If-None-Match: {etag}\r\n" if etag else ""
+    request = f"GET {route} HTTP/1.1\r\nHost: {host}\r\n{extra}\r\n".encode("ascii") * pipeline
+    done = 0
+    statuses: Counter = Counter()
+    try:
+        while time.perf_counter() < deadline:
+            writer.write(request)
+            for _ in range(pipeline):
+                status_line = await reader.readline()
+                parts = status_line.split(b" ", 2)
+                if len(parts) < 2:
+                    # Server closed the connection; report what completed so far.
+                    return done, statuses
+                status = parts[1]
+                statuses[status.decode("ascii")] += 1
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length and status == b"200":
+                    await reader.readexactly(length)
+                done += 1
+    finally:
+        writer.close()
+    return done, statuses
+
+
+async def _run_load(host: str, port: int, duration: float, connections: int, pipeline: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for route in ("/leaderboard", "/stats"):
+        # Grab the current ETag so half of the scenarios exercise the 304 path.
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"HEAD {route} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("ascii"))
+        raw = await reader.read()
+        writer.close()
+        etag = next(
+            (line.split(":", 1)[1].strip() for line in raw.decode("latin-1").split("\r\n") if line.lower().startswith("etag:")),
+            None,
+        )
+
+        for label, tag in (("200", None), ("304", etag)):
+            if label == "304" and etag is None:
+                results[f"{route} {label}"] = {
+                    "expected": label,
+                    "requests": 0,
+                    "requests_per_sec": 0.0,
+                    "statuses": {},
+                    "error": "no ETag in HEAD response",
+                }
+                continue
+            start = time.perf_counter()
+            deadline = start + duration
+            outcomes = await asyncio.gather(
+                *(_load_worker(host, port, route, tag, deadline, pipeline) for _ in range(connections))
+            )
+            elapsed = time.perf_counter() - start
+            total = sum(done for done, _ in outcomes)
+            statuses: Counter = Counter()
+            for _, counts in outcomes:
+                statuses.update(counts)
+            results[f"{route} {label}"] = {
+                "expected": label,
+                "requests": total,
+                "requests_per_sec": total / elapsed,
+                "statuses": dict(statuses),
+            }
+    return results
+
+
+def scenario_problem(result: Dict[str, Any], min_rps: float) -> Optional[str]:
+    """Returns why a load-test scenario failed, or None if it passed."""
+    if result.get("error"):
+        return result["error"]
+    if set(result["statuses"]) != {result["expected"]}:
+        return f"expected only {result['expected']} responses"
+    if result["requests_per_sec"] < min_rps:
+        return "SLOW"
+    return None
+
+
+def load_test(
+    path: str = LEADERBOARD_FILE,
+    port: int = DEFAULT_PORT,
+    duration: float = 3.0,
+    connections: int = 32,
+    pipeline: int = 1,
+    min_rps: float = 2000.0,
+) -> bool:
+    """Runs the server in its own process (one core) and hammers it from this one."""
+    server = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--host", DEFAULT_HOST, "--port", str(port), "--file", path],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert server.stdout is not None
+        banner = server.stdout.readline()
+        if not banner.startswith("Serving"):
+            print(f"Server failed to start on port {port} (exit code {server.poll()}).")
+            return False
+        results = asyncio.run(_run_load(DEFAULT_HOST, port, duration, connections, pipeline))
+    except OSError as exc:
+        print(f"Load test could not reach the server: {exc}")
+        return False
+    finally:
+        server.terminate()
+        server.wait()
+
+    passed = True
+    for name, result in results.items():
+        problem = scenario_problem(result, min_rps)
+        passed = passed and problem is None
+        print(f"{name:<18} {result['requests_per_sec']:>10.0f} req/s  {result['statuses']}  {problem or 'OK'}")
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Read-only leaderboard/stats HTTP endpoint.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--file", default=LEADERBOARD_FILE, help="Leaderboard JSON file to serve.")
+    parser.add_argument("--load-test", action="store_true", help="Run a local load test instead of serving.")
+    parser.add_argument("--duration", type=float, default=3.0, help="Load test seconds per scenario.")
+    parser.add_argument("--connections", type=int, default=32, help="Load test concurrent connections.")
+    parser.add_argument("--min-rps", type=float, default=2000.0, help="Load test pass threshold.")
+    args = parser.parse_args()
+
+    if args.load_test:
+        passed = load_test(args.file, port=args.port, duration=args.duration, connections=args.connections, min_rps=args.min_rps)
+        sys.exit(0 if passed else 1)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.file))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import List
 
 from llm_generator import generate_ai_puzzle
+from settings import DIFFICULTY_CALIBRATION_FILE
+from utils import load_json_file
 
 
 @dataclass
@@ -17,12 +19,21 @@ class Puzzle:
     hints: List[str]
     explanation: str
     difficulty: str = "easy"
+    # Hand-assigned difficulty from the puzzle file; `difficulty` may be replaced by calibration.
+    label: str = ""
+    source: str = "fallback"
 
 
 class PuzzleProvider:
-    def __init__(self, fallback_path: str = "fallback_puzzles.json") -> None:
+    def __init__(
+        self,
+        fallback_path: str = "fallback_puzzles.json",
+        calibration_path: str = DIFFICULTY_CALIBRATION_FILE,
+    ) -> None:
         self.fallback_path = Path(fallback_path)
+        self.calibration_path = calibration_path
         self._fallback_puzzles = self._load_fallback_puzzles()
+        self._apply_calibration()
 
     def _load_fallback_puzzles(self) -> List[Puzzle]:
         if not self.fallback_path.exists():
@@ -41,10 +52,21 @@ class PuzzleProvider:
                     hints=item["hints"],
                     explanation=item["explanation"],
                     difficulty=item.get("difficulty", "easy"),
+                    label=item.get("difficulty", "easy"),
                 )
             )
         return puzzles
 
+    def _apply_calibration(self) -> None:
+        # Measured difficulty (see calibration.py) replaces the hand-assigned label when available.
+        calibration = load_json_file(self.calibration_path, default={})
+        if not isinstance(calibration, dict):
+            return
+        for puzzle in self._fallback_puzzles:
+            entry = calibration.get(puzzle.question)
+            if isinstance(entry, dict) and entry.get("difficulty"):
+                puzzle.difficulty = str(entry["difficulty"])
+
     def get_puzzle(
         self,
         difficulty: str = "easy",
@@ -70,6 +92,7 @@ class PuzzleProvider:
                     hints=ai_puzzle["hints"],
                     explanation=ai_puzzle["explanation"],
                     difficulty=ai_puzzle.get("difficulty", difficulty),
+                    source="ai",
                 )
 
         return random.choice(filtered)
\ No newline at end of file
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import itertools
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from game import SCORING_WEIGHTS, GameConfig, PuzzleForgeGame, ScoringWeights
+
+
+@dataclass
+class RoundHistory:
+    """Columnar view of recorded solved rounds: one array per _calculate_points input."""
+
+    attempts: np.ndarray
+    hints: np.ndarray
+    seconds: np.ndarray
+    streak: np.ndarray
+    timer_mode: np.ndarray
+
+    @classmethod
+    def from_arrays(
+        cls,
+        attempts: Iterable[int],
+        hints: Iterable[int],
+        seconds: Iterable[int],
+        streak: Iterable[int],
+        timer_mode: Iterable[bool],
+    ) -> "RoundHistory":
+        history = cls(
+            attempts=np.asarray(attempts, dtype=np.int64),
+            hints=np.asarray(hints, dtype=np.int64),
+            seconds=np.asarray(seconds, dtype=np.int64),
+            streak=np.asarray(streak, dtype=np.int64),
+            timer_mode=np.asarray(timer_mode, dtype=bool),
+        )
+        sizes = {len(getattr(history, f.name)) for f in fields(history)}
+        if len(sizes) > 1:
+            raise ValueError("All round history arrays must have the same length.")
+        return history
+
+    def __len__(self) -> int:
+        return len(self.attempts)
+
+    def slice(self, start: int, stop: int) -> "RoundHistory":
+        return RoundHistory(
+            attempts=self.attempts[start:stop],
+            hints=self.hints[start:stop],
+            seconds=self.seconds[start:stop],
+            streak=self.streak[start:stop],
+            timer_mode=self.timer_mode[start:stop],
+        )
+
+
+def weight_grid(**axes: Sequence[int]) -> List[ScoringWeights]:
+    """
+    Builds the cartesian product of the given weight values.
+    Weights not listed keep the game's defaults, e.g.
+    weight_grid(base=[100, 120], hint_penalty=[10, 15, 20]) -> 6 configs.
+    """
+    valid = {f.name for f in fields(ScoringWeights)}
+    unknown = set(axes) - valid
+    if unknown:
+        raise ValueError(f"Unknown scoring weights: {', '.join(sorted(unknown))}")
+
+    names = list(axes)
+    return [ScoringWeights(**dict(zip(names, combo))) for combo in itertools.product(*axes.values())]
+
+
+def _weights_matrix(grid: Sequence[ScoringWeights]) -> Dict[str, np.ndarray]:
+    # One (k, 1) column per weight so it broadcasts against (1, n) round rows.
+    return {
+        f.name: np.array([getattr(w, f.name) for w in grid], dtype=np.int64)[:, None]
+        for f in fields(ScoringWeights)
+    }
+
+
+def rescore(history: RoundHistory, grid: Sequence[ScoringWeights]) -> np.ndarray:
+    """
+    Returns a (len(grid), len(history)) int64 array of round points,
+    one row per weight configuration.
+    """
+    w = _weights_matrix(grid)
+    shape = (len(grid), len(history))
+    # Everything is accumulated into two (k, n) buffers to keep peak memory predictable.
+    points = np.empty(shape, dtype=np.int64)
+    scratch = np.empty(shape, dtype=np.int64)
+
+    np.multiply(history.attempts - 1, w["attempt_penalty"], out=points)
+    np.multiply(history.hints, w["hint_penalty"], out=scratch)
+    points += scratch
+
+    np.floor_divide(history.seconds, w["time_step"], out=scratch)
+    np.minimum(scratch, w["time_penalty_cap"], out=scratch)
+    scratch *= history.timer_mode
+    points += scratch
+
+    np.multiply(history.streak, w["streak_bonus"], out=scratch)
+    np.minimum(scratch, w["streak_bonus_cap"], out=scratch)
+    points -= scratch
+
+    np.subtract(w["base"], points, out=points)
+    np.maximum(points, w["min_points"], out=points)
+    return points
+
+
+def rescore_totals(
+    history: RoundHistory,
+    grid: Sequence[ScoringWeights],
+    chunk_size: int = 50_000,
+) -> np.ndarray:
+    """
+    Sums round points per weight configuration.
+    Rounds are processed in chunks; peak memory is about two int64 buffers of
+    len(grid) * chunk_size values (e.g. ~65 MB for 81 configs at the default chunk size).
+    """
+    totals = np.zeros(len(grid), dtype=np.int64)
+    for start in range(0, len(history), chunk_size):
+        totals += rescore(history.slice(start, start + chunk_size), grid).sum(axis=1)
+    return totals
+
+
+def summarize(history: RoundHistory, grid: Sequence[ScoringWeights], chunk_size: int = 50_000) -> List[Dict[str, float]]:
+    """Per-configuration weights plus total and mean round points, for tuning reports."""
+    totals = rescore_totals(history, grid, chunk_size=chunk_size)
+    rounds = max(len(history), 1)
+    return [
+        {**asdict(weights), "total_points": int(total), "mean_points": float(total) / rounds}
+        for weights, total in zip(grid, totals)
+    ]
+
+
+def _scalar_points(attempts: int, hints: int, seconds: int, streak: int, timer_mode: bool) -> int:
+    # Skip __init__ so no puzzle file is needed; _calculate_points only reads config and streak.
+    game = PuzzleForgeGame.__new__(PuzzleForgeGame)
+    game.config = GameConfig(timer_mode=timer_mode)
+    game.streak = streak
+    return game._calculate_points(attempts_used=attempts, hints_used=hints, seconds_used=seconds)
+
+
+def verify_parity(history: RoundHistory, sample_size: int = 10_000, seed: int = 0) -> None:
+    """
+    Checks that default-weight vectorized scores match PuzzleForgeGame._calculate_points
+    on a random sample of rounds. Raises AssertionError on the first mismatch.
+    """
+    if len(history) == 0:
+        return
+
+    rng = np.random.default_rng(seed)
+    count = min(sample_size, len(history))
+    idx = rng.choice(len(history), size=count, replace=False)
+    sample = RoundHistory(
+        attempts=history.attempts[idx],
+        hints=history.hints[idx],
+        seconds=history.seconds[idx],
+        streak=history.streak[idx],
+        timer_mode=history.timer_mode[idx],
+    )
+    vectorized = rescore(sample, [SCORING_WEIGHTS])[0]
+
+    for i in range(count):
+        expected = _scalar_points(
+            int(sample.attempts[i]),
+            int(sample.hints[i]),
+            int(sample.seconds[i]),
+            int(sample.streak[i]),
+            bool(sample.timer_mode[i]),
+        )
+        if int(vectorized[i]) != expected:
+            raise AssertionError(
+                f"Score mismatch at round {int(idx[i])}: vectorized={int(vectorized[i])}, scalar={expected}"
+            )
@@ -38,4 +38,6 @@ THEMES = {
 DEFAULT_THEME = "scifi"
 
 MAX_ATTEMPTS = 3
-LEADERBOARD_FILE = "leaderboard.json"
\ No newline at end of file
+LEADERBOARD_FILE = "leaderboard.json"
+ROUND_HISTORY_FILE = "round_history.jsonl"
+DIFFICULTY_CALIBRATION_FILE = "difficulty_calibration.json"
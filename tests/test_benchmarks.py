@@ -0,0 +1,18 @@
+import importlib.util
+
+from benchmarks import run
+
+
+def test_run_smoke(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    report = run([10], [0], seed=1)
+
+    assert set(report) == {"meta", "corpus", "leaderboard", "ai_generation"}
+    assert set(report["corpus"]["10"]) >= {"load_ms", "get_puzzle", "get_puzzle_demo", "grading"}
+    assert report["corpus"]["10"]["grading"]["answers"] == 10
+    assert set(report["leaderboard"]["10"]) >= {"save_score", "show_leaderboard", "show_leaderboard_after_save"}
+    if importlib.util.find_spec("openai") is None:
+        assert "skipped" in report["ai_generation"]
+    else:
+        assert report["ai_generation"]["0"]["generate_ai_puzzle"]["failures"] == 0
@@ -0,0 +1,163 @@
+import json
+
+from calibration import PuzzleStats, aggregate_rounds, assign_difficulties, calibrate, iter_round_records
+from game import GameConfig, PuzzleForgeGame
+from puzzles import Puzzle
+
+
+def _round(question, difficulty="easy", solved=True, seconds=0, timer_mode=True, hints=0, attempts=1):
+    return {
+        "question": question,
+        "difficulty": difficulty,
+        "solved": solved,
+        "attempts": attempts,
+        "hints": hints,
+        "seconds": seconds,
+        "streak": 0,
+        "timer_mode": timer_mode,
+    }
+
+
+def test_percentiles_on_known_histogram():
+    stats = PuzzleStats(label="easy")
+    for seconds in range(1, 101):
+        stats.add(_round("Q", seconds=seconds))
+
+    assert stats.solve_seconds_percentile(50) == 50
+    assert stats.solve_seconds_percentile(90) == 90
+    assert stats.solve_seconds_percentile(99) == 99
+    assert stats.solve_seconds_percentile(100) == 100
+
+
+def test_percentiles_ignore_timer_off_rounds():
+    stats = PuzzleStats(label="easy")
+    for _ in range(30):
+        stats.add(_round("Q", seconds=0, timer_mode=False))
+    for _ in range(30):
+        stats.add(_round("Q", seconds=100))
+
+    assert stats.solve_seconds_percentile(50) == 100
+    assert stats.solved == 60
+    assert stats.rounds == 60
+
+
+def test_percentile_is_none_without_timed_solves():
+    stats = PuzzleStats(label="easy")
+    stats.add(_round("Q", solved=False))
+    stats.add(_round("Q", timer_mode=False))
+
+    assert stats.solve_seconds_percentile(50) is None
+
+
+def test_malformed_fields_are_coerced():
+    stats = aggregate_rounds([{"question": "B", "hints": None, "attempts": "x", "solved": True, "timer_mode": True}])
+
+    assert stats["B"].rounds == 1
+    assert stats["B"].hints_total == 0
+    assert stats["B"].solve_seconds_percentile(50) == 0
+
+
+def test_iter_round_records_skips_bad_lines(tmp_path):
+    history = tmp_path / "history.jsonl"
+    history.write_text(
+        "\n".join(
+            [
+                json.dumps(_round("A")),
+                "not json",
+                json.dumps({"question": ["list"]}),
+                json.dumps([1, 2]),
+                "",
+                json.dumps(_round("B")),
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    assert [r["question"] for r in iter_round_records(str(history))] == ["A", "B"]
+
+
+def test_relabeling_preserves_label_quotas():
+    records = []
+    # Hand labels say easy/easy/medium/hard, but measured hardness is the reverse order.
+    for question, label, solve_every in [("A", "easy", 10), ("B", "easy", 5), ("C", "medium", 2), ("D", "hard", 1)]:
+        for i in range(20):
+            records.append(_round(question, label, solved=i % solve_every == 0))
+    stats = aggregate_rounds(records)
+
+    assigned = assign_difficulties(stats, min_rounds=20)
+
+    assert assigned == {"D": "easy", "C": "easy", "B": "medium", "A": "hard"}
+    assert sorted(assigned.values()) == sorted(entry.label for entry in stats.values())
+
+
+def test_puzzles_below_min_rounds_keep_their_label():
+    records = [_round("A", "hard", solved=True) for _ in range(5)]
+    records += [_round("B", "easy", solved=False) for _ in range(20)]
+
+    assigned = assign_difficulties(aggregate_rounds(records), min_rounds=20)
+
+    assert assigned == {"A": "hard", "B": "easy"}
+
+
+def test_calibrate_writes_file(tmp_path):
+    history = tmp_path / "history.jsonl"
+    history.write_text("\n".join(json.dumps(_round("A", seconds=30)) for _ in range(3)), encoding="utf-8")
+    output = tmp_path / "calibration.json"
+
+    calibrate(str(history), str(output), min_rounds=1)
+
+    entry = json.loads(output.read_text(encoding="utf-8"))["A"]
+    assert entry["difficulty"] == "easy"
+    assert entry["p50_seconds"] == 30
+
+
+def _game(tmp_path, monkeypatch):
+    monkeypatch.setattr("game.ROUND_HISTORY_FILE", str(tmp_path / "history.jsonl"))
+    game = PuzzleForgeGame.__new__(PuzzleForgeGame)
+    game.config = GameConfig()
+    game.streak = 0
+    return game
+
+
+def test_record_round_uses_hand_assigned_label(tmp_path, monkeypatch):
+    game = _game(tmp_path, monkeypatch)
+    puzzle = Puzzle("Logic", "Q?", "a", ["h"], "e", difficulty="hard", label="easy")
+
+    game._record_round(puzzle, True, 1, 0, 12)
+
+    record = json.loads((tmp_path / "history.jsonl").read_text(encoding="utf-8"))
+    assert record["difficulty"] == "easy"
+
+
+def test_record_round_skips_ai_puzzles(tmp_path, monkeypatch):
+    game = _game(tmp_path, monkeypatch)
+    puzzle = Puzzle("Logic", "Q?", "a", ["h"], "e", source="ai")
+
+    game._record_round(puzzle, True, 1, 0, 12)
+
+    assert not (tmp_path / "history.jsonl").exists()
+
+
+def test_record_round_skips_demo_mode(tmp_path, monkeypatch):
+    game = _game(tmp_path, monkeypatch)
+    game.config = GameConfig(demo_mode=True)
+
+    game._record_round(Puzzle("Logic", "Q?", "a", ["h"], "e"), True, 1, 0, 12)
+
+    assert not (tmp_path / "history.jsonl").exists()
+
+
+def test_record_round_survives_unwritable_history(tmp_path, monkeypatch):
+    game = _game(tmp_path, monkeypatch)
+    history = tmp_path / "missing" / "history.jsonl"
+    monkeypatch.setattr("game.ROUND_HISTORY_FILE", str(history))
+
+    assert game._record_round(Puzzle("Logic", "Q?", "a", ["h"], "e"), True, 1, 0, 12) is None
+    assert not history.exists()
+
+
+def test_iter_round_records_skips_invalid_utf8(tmp_path):
+    history = tmp_path / "history.jsonl"
+    history.write_bytes(b"\xff\xfe\n" + json.dumps(_round("A")).encode("utf-8") + b"\n")
+
+    assert [r["question"] for r in iter_round_records(str(history))] == ["A"]
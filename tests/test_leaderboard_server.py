@@ -0,0 +1,164 @@
+import json
+
+import pytest
+
+from leaderboard_server import LeaderboardCache, LeaderboardProtocol, _etag_matches, scenario_problem
+
+
+class FakeTransport:
+    def __init__(self):
+        self.written = b""
+        self.closed = False
+
+    def write(self, data):
+        self.written += data
+
+    def close(self):
+        self.closed = True
+
+    def is_closing(self):
+        return self.closed
+
+
+ROWS = [
+    {"player": "Ada", "score": 300, "rounds": 5, "difficulty": "hard", "theme": "scifi"},
+    {"player": "Bo", "score": 120, "rounds": 3, "difficulty": "easy", "theme": "classic"},
+]
+
+
+@pytest.fixture
+def board(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    path.write_text(json.dumps(ROWS), encoding="utf-8")
+    return path
+
+
+def _cache(path):
+    # poll_interval=0 re-checks the file on every request.
+    return LeaderboardCache(str(path), poll_interval=0)
+
+
+def _request(cache, raw):
+    transport = FakeTransport()
+    protocol = LeaderboardProtocol(cache)
+    protocol.connection_made(transport)
+    protocol.data_received(raw)
+    return transport
+
+
+def _responses(written):
+    # Splits a byte stream into (status, headers, body) tuples using Content-Length.
+    out = []
+    while written:
+        head, _, rest = written.partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:])}
+        length = int(headers.get("content-length", 0)) if lines[0].split()[1] != "304" else 0
+        out.append((int(lines[0].split()[1]), headers, rest[:length]))
+        written = rest[length:]
+    return out
+
+
+def test_etag_matching():
+    assert _etag_matches('"abc"', '"abc"')
+    assert _etag_matches('W/"abc"', '"abc"')
+    assert _etag_matches('"x", "abc"', '"abc"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches('"abd"', '"abc"')
+
+
+def test_get_leaderboard_returns_rows_and_etag(board):
+    (status, headers, body), = _responses(_request(_cache(board), b"GET /leaderboard HTTP/1.1\r\n\r\n").written)
+
+    assert status == 200
+    assert headers["etag"]
+    assert [row["player"] for row in json.loads(body)] == ["Ada", "Bo"]
+    assert json.loads(body)[0]["rank"] == 1
+
+
+def test_if_none_match_hit_and_miss(board):
+    cache = _cache(board)
+    (_, headers, _), = _responses(_request(cache, b"GET /stats HTTP/1.1\r\n\r\n").written)
+    etag = headers["etag"]
+
+    hit = _responses(_request(cache, f"GET /stats HTTP/1.1\r\nIf-None-Match: {etag}\r\n\r\n".encode()).written)
+    weak = _responses(_request(cache, f"GET /stats HTTP/1.1\r\nIf-None-Match: W/{etag}\r\n\r\n".encode()).written)
+    miss = _responses(_request(cache, b'GET /stats HTTP/1.1\r\nIf-None-Match: "stale"\r\n\r\n').written)
+
+    assert hit[0][0] == 304 and hit[0][2] == b""
+    assert weak[0][0] == 304
+    assert miss[0][0] == 200 and json.loads(miss[0][2])["entries"] == 2
+
+
+def test_http10_closes_and_http11_keeps_alive(board):
+    cache = _cache(board)
+
+    old = _request(cache, b"GET /stats HTTP/1.0\r\n\r\n")
+    new = _request(cache, b"GET /stats HTTP/1.1\r\n\r\n")
+
+    assert old.closed and _responses(old.written)[0][1]["connection"] == "close"
+    assert not new.closed and _responses(new.written)[0][1]["connection"] == "keep-alive"
+
+
+def test_pipelined_requests_get_responses_in_order(board):
+    raw = b"GET /stats HTTP/1.1\r\n\r\nGET /nope HTTP/1.1\r\n\r\nGET /leaderboard HTTP/1.1\r\n\r\n"
+
+    responses = _responses(_request(_cache(board), raw).written)
+
+    assert [status for status, _, _ in responses] == [200, 404, 200]
+    assert json.loads(responses[0][2])["entries"] == 2
+    assert len(json.loads(responses[2][2])) == 2
+
+
+def test_bad_request_line_closes_connection(board):
+    transport = _request(_cache(board), b"garbage\r\n\r\n")
+
+    assert transport.written.startswith(b"HTTP/1.1 400")
+    assert transport.closed
+
+
+def test_truncated_file_keeps_previous_cache(board):
+    cache = _cache(board)
+    before = cache.get("/leaderboard")
+
+    board.write_text(json.dumps(ROWS)[:15], encoding="utf-8")
+
+    assert cache.get("/leaderboard") is before
+    board.write_text(json.dumps(ROWS[:1]), encoding="utf-8")
+    assert [row["player"] for row in json.loads(cache.get("/leaderboard").body)] == ["Ada"]
+
+
+def test_malformed_rows_keep_previous_cache(board):
+    cache = _cache(board)
+    before = cache.get("/stats")
+
+    board.write_text(json.dumps([{"player": "Eve", "score": "lots"}]), encoding="utf-8")
+
+    assert cache.get("/stats") is before
+    assert _request(cache, b"GET /stats HTTP/1.1\r\n\r\n").written.startswith(b"HTTP/1.1 200 OK")
+
+
+def test_missing_file_serves_empty_board(tmp_path):
+    cache = _cache(tmp_path / "missing.json")
+
+    assert json.loads(cache.get("/leaderboard").body) == []
+
+
+def _scenario(expected, statuses, rps=5000.0, **extra):
+    return {"expected": expected, "statuses": statuses, "requests_per_sec": rps, **extra}
+
+
+def test_load_scenario_passes_with_expected_statuses():
+    assert scenario_problem(_scenario("200", {"200": 100}), min_rps=2000) is None
+    assert scenario_problem(_scenario("304", {"304": 100}), min_rps=2000) is None
+
+
+def test_load_scenario_fails_on_unexpected_statuses():
+    assert scenario_problem(_scenario("304", {"200": 100}), min_rps=2000)
+    assert scenario_problem(_scenario("200", {"200": 90, "404": 10}), min_rps=2000)
+    assert scenario_problem(_scenario("200", {}), min_rps=2000)
+
+
+def test_load_scenario_fails_when_slow_or_etag_missing():
+    assert scenario_problem(_scenario("200", {"200": 100}, rps=10), min_rps=2000) == "SLOW"
+    assert scenario_problem(_scenario("304", {}, rps=0, error="no ETag in HEAD response"), min_rps=2000)
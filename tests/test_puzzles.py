@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from puzzles import PuzzleProvider
+
+PUZZLES = [
+    {"category": "Riddle", "question": "Q1", "answer": "a", "hints": ["h"], "explanation": "e", "difficulty": "easy"},
+    {"category": "Logic", "question": "Q2", "answer": "b", "hints": ["h"], "explanation": "e", "difficulty": "hard"},
+]
+
+
+@pytest.fixture
+def puzzle_file(tmp_path):
+    path = tmp_path / "puzzles.json"
+    path.write_text(json.dumps(PUZZLES), encoding="utf-8")
+    return path
+
+
+def _provider(puzzle_file, calibration):
+    calibration_path = puzzle_file.parent / "calibration.json"
+    calibration_path.write_text(json.dumps(calibration), encoding="utf-8")
+    return PuzzleProvider(str(puzzle_file), calibration_path=str(calibration_path))
+
+
+def test_calibration_overrides_difficulty_filter(puzzle_file):
+    provider = _provider(puzzle_file, {"Q1": {"difficulty": "hard"}, "Q2": {"difficulty": "easy"}})
+
+    assert {provider.get_puzzle(difficulty="easy").question for _ in range(20)} == {"Q2"}
+    assert {provider.get_puzzle(difficulty="hard").question for _ in range(20)} == {"Q1"}
+
+
+def test_calibration_keeps_hand_assigned_label(puzzle_file):
+    provider = _provider(puzzle_file, {"Q1": {"difficulty": "hard"}, "Q2": {"difficulty": "easy"}})
+
+    q1 = provider.get_puzzle(difficulty="hard")
+    assert q1.question == "Q1"
+    assert q1.difficulty == "hard"
+    assert q1.label == "easy"
+
+
+@pytest.mark.parametrize("calibration", [[1, 2], {"Q1": "hard"}, {"Q1": {"difficulty": ""}}])
+def test_malformed_calibration_leaves_labels(puzzle_file, calibration):
+    provider = _provider(puzzle_file, calibration)
+
+    assert {provider.get_puzzle(difficulty="easy").question for _ in range(20)} == {"Q1"}
+    assert {provider.get_puzzle(difficulty="hard").question for _ in range(20)} == {"Q2"}
+
+
+def test_missing_calibration_file_uses_labels(puzzle_file):
+    provider = PuzzleProvider(str(puzzle_file), calibration_path=str(puzzle_file.parent / "none.json"))
+
+    assert provider.get_puzzle(difficulty="hard").question == "Q2"
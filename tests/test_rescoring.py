@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from game import ScoringWeights
+from rescoring import RoundHistory, rescore, rescore_totals, verify_parity, weight_grid
+
+
+def _history(n=5000, seed=7):
+    rng = np.random.default_rng(seed)
+    return RoundHistory.from_arrays(
+        attempts=rng.integers(1, 4, n),
+        # Up to 6 hints plus 3 attempts drives scores under the min_points floor.
+        hints=rng.integers(0, 7, n),
+        seconds=rng.integers(-20, 400, n),
+        streak=rng.integers(0, 10, n),
+        timer_mode=rng.random(n) < 0.5,
+    )
+
+
+def test_vectorized_scores_match_calculate_points():
+    history = _history()
+    points = rescore(history, [ScoringWeights()])[0]
+
+    # The sample exercises every branch of _calculate_points.
+    assert (points == ScoringWeights().min_points).any()
+    assert (history.streak * 5 > 25).any()
+    assert (history.seconds <= 0).any()
+    assert history.timer_mode.any() and not history.timer_mode.all()
+
+    verify_parity(history, sample_size=len(history))
+
+
+def test_chunked_totals_match_unchunked():
+    history = _history(n=1000)
+    grid = weight_grid(base=[100, 120], hint_penalty=[10, 15], time_step=[5, 10])
+
+    np.testing.assert_array_equal(rescore_totals(history, grid, chunk_size=7), rescore(history, grid).sum(axis=1))
+
+
+def test_weight_grid_is_cartesian_product():
+    grid = weight_grid(base=[100, 110, 120], hint_penalty=[10, 15])
+
+    assert len(grid) == 6
+    assert {(w.base, w.hint_penalty) for w in grid} == {(b, h) for b in (100, 110, 120) for h in (10, 15)}
+    assert all(w.attempt_penalty == ScoringWeights().attempt_penalty for w in grid)
+
+
+def test_weight_grid_rejects_unknown_weights():
+    with pytest.raises(ValueError):
+        weight_grid(bonus=[1])
+
+
+def test_zero_time_step_is_rejected():
+    with pytest.raises(ValueError):
+        weight_grid(time_step=[0])
+    with pytest.raises(ValueError):
+        ScoringWeights(time_step=0)
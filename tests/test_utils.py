@@ -0,0 +1,13 @@
+import json
+
+from utils import save_json_file
+
+
+def test_save_json_file_replaces_atomically(tmp_path):
+    path = tmp_path / "leaderboard.json"
+    path.write_text("[1]", encoding="utf-8")
+
+    save_json_file(str(path), [{"score": 10}])
+
+    assert json.loads(path.read_text(encoding="utf-8")) == [{"score": 10}]
+    assert [p.name for p in tmp_path.iterdir()] == ["leaderboard.json"]
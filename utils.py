@@ -91,9 +91,26 @@ def load_json_file(path: str, default: Any) -> Any:
 
 
 def save_json_file(path: str, data: Any) -> None:
+    # Write to a sibling temp file and swap it in, so readers never see a half-written file.
     p = Path(path)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    tmp = p.with_name(f".{p.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, p)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def append_jsonl_record(path: str, record: Any) -> None:
+    # Best-effort: a read-only or full disk must not interrupt a running game.
+    p = Path(path)
+    try:
+        with p.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError:
+        pass
 
 
 def wait() -> None: